@@ -0,0 +1,52 @@
+"""
+    Optional Numba-accelerated scan kernels for the trading calendar
+    ----------------------------------------------------------------
+
+    The hot calendar queries reduce to "find the first True at or after a
+    position" and "collect the True positions inside a slice" over a boolean
+    mask. With Numba installed the kernels compile to tight native loops;
+    without it the NumPy fallbacks below provide the same interface, so the
+    dependency stays optional.
+
+    MIT License - see LICENSE file for details.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def first_true_after(mask, pos):
+        for i in range(pos, mask.shape[0]):
+            if mask[i]:
+                return i
+        return -1
+
+    @njit(cache=True)
+    def true_positions(mask, lo, hi):
+        out = np.empty(hi - lo, dtype=np.int64)
+        k = 0
+        for i in range(lo, hi):
+            if mask[i]:
+                out[k] = i
+                k += 1
+        return out[:k]
+
+else:
+
+    def first_true_after(mask, pos):
+        tail = mask[pos:]
+        if tail.size:
+            offset = int(tail.argmax())
+            if tail[offset]:
+                return pos + offset
+        return -1
+
+    def true_positions(mask, lo, hi):
+        return lo + np.flatnonzero(mask[lo:hi])
@@ -17,15 +17,24 @@
 
 import json
 import logging
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from pytz import timezone
 from pytz import timezone as pytz_timezone
 from enum import Enum
 import asyncio
-import json5 as json  # JSON5 is a superset of JSON that allows comments and trailing commas
+import json5  # JSON5 is a superset of JSON that allows comments and trailing commas
+
+try:
+    import orjson  # Optional fast path for plain-JSON configs
+except ImportError:
+    orjson = None
+
+from ._kernels import first_true_after, true_positions
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -42,14 +51,30 @@ ch.setFormatter(formatter)
 # Add handler to logger
 logger.addHandler(ch)
 
-def error_logger(func):
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            raise
-    return wrapper
+# Interned datetime.time objects keyed by (hour, minute). There are at most
+# 1,440 distinct wall-clock minutes, so each "HH:MM" value is parsed and
+# allocated exactly once across all loaded exchange configs.
+_TIME_CACHE: Dict[Tuple[int, int], time] = {}
+
+def _mk_time(hm: str) -> time:
+    hour, minute = hm.split(":")
+    key = (int(hour), int(minute))
+    cached = _TIME_CACHE.get(key)
+    if cached is None:
+        cached = time(*key)
+        _TIME_CACHE[key] = cached
+    return cached
+
+def error_logger(message):
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{message} in {func.__name__}: {str(e)}")
+                raise
+        return wrapper
+    return decorator
 
 # ExchangeInfo class ----------------------------------------------------------
 class ExchangeInfo:
@@ -66,12 +91,13 @@ class ExchangeInfo:
                 open_time (time): Opening time of the exchange
                 close_time (time): Closing time of the exchange
                 trading_days (List[int]): List of trading days (0=Monday, 1=Tuesday, ..., 6=Sunday)
-                holidays (List[datetime.date]): List of holidays
-                special_trading_days (List[Dict[str, str]]): List of special trading days with open and close times
+                holidays (frozenset[datetime.date]): Set of holidays
+                special_trading_days (Dict[datetime.date, Tuple[time, time]]): Special trading days mapped to (open, close) times
         """
         try:
-            with open(json_file_path, "r") as file:
-                data = json.load(file)
+            with open(json_file_path, "rb") as file:
+                raw = file.read()
+            data = self._parse_config(raw)
             logger.info(f"Loaded exchange info from {json_file_path}")
         except Exception as e:
             logger.error(f"Error loading exchange info from {json_file_path}: {e}")
@@ -93,13 +119,38 @@ class ExchangeInfo:
 
         self.name = data["name"]
         self.timezone = pytz_timezone(data["timezone"])
-        self.open_time = datetime.strptime(data["open_time"], "%H:%M").time()
-        self.close_time = datetime.strptime(data["close_time"], "%H:%M").time()
+        self.open_time = _mk_time(data["open_time"])
+        self.close_time = _mk_time(data["close_time"])
+        self._default_open_min = self.open_time.hour * 60 + self.open_time.minute
+        self._default_close_min = self.close_time.hour * 60 + self.close_time.minute
         self.trading_days = data["trading_days"]
-        self.holidays = [
-            datetime.strptime(date, "%Y-%m-%d").date() for date in data["holidays"]
-        ]
-        self.special_trading_days = data.get("special_trading_days", [])
+        # Boolean lookup table indexed by weekday, so membership is a
+        # single gather instead of a linear scan over the list
+        self._weekday_lut = np.zeros(7, dtype=bool)
+        self._weekday_lut[list(data["trading_days"])] = True
+        self.holidays = frozenset(
+            datetime.strptime(day, "%Y-%m-%d").date() for day in data["holidays"]
+        )
+        self.special_trading_days = {
+            datetime.strptime(day["date"], "%Y-%m-%d").date(): (
+                _mk_time(day["open_time"]),
+                _mk_time(day["close_time"]),
+            )
+            for day in data.get("special_trading_days", [])
+        }
+        # Sorted parallel arrays of the special days for batch lookups
+        special_dates = sorted(self.special_trading_days)
+        self._special_dates = np.array(special_dates, dtype="datetime64[D]")
+        self._special_open_min = np.array(
+            [self.special_trading_days[d][0].hour * 60 + self.special_trading_days[d][0].minute
+             for d in special_dates],
+            dtype=np.int16,
+        )
+        self._special_close_min = np.array(
+            [self.special_trading_days[d][1].hour * 60 + self.special_trading_days[d][1].minute
+             for d in special_dates],
+            dtype=np.int16,
+        )
 
         # Optional: Load holiday calendar if specified in JSON
         self.holiday_calendar = None
@@ -108,6 +159,49 @@ class ExchangeInfo:
             if calendar_name in globals():
                 self.holiday_calendar = globals()[calendar_name]()
 
+        # Primed by prime_holiday_cache for range queries
+        self._calendar_holidays = None
+        self._calendar_holiday_range = None
+
+    def prime_holiday_cache(
+        self,
+        start,
+        end
+    ) -> None:
+        """
+        Precompute the pandas holiday-calendar dates for [start, end]
+
+        HolidayCalendar.holidays evaluates every registered rule on each
+        call, so computing the full range once turns the per-date check
+        into a set lookup.
+        """
+        if not self.holiday_calendar:
+            return
+        holidays = self.holiday_calendar.holidays(start=start, end=end)
+        self._calendar_holidays = frozenset(ts.date() for ts in holidays)
+        self._calendar_holiday_range = (start.date(), end.date())
+
+    @staticmethod
+    def _parse_config(raw: bytes) -> Dict:
+        """
+        Parse exchange config bytes, fastest parser first
+
+        Plain-JSON configs go through orjson (if installed) or the stdlib
+        parser; configs using JSON5 features such as comments or trailing
+        commas fall back to the much slower pure-Python json5 parser.
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        else:
+            try:
+                return json.loads(raw)
+            except ValueError:
+                pass
+        return json5.loads(raw.decode("utf-8"))
+
     def is_trading_day(
         self,
         date
@@ -115,7 +209,7 @@ class ExchangeInfo:
         """
         Is the given date a trading day for the exchange
         """
-        return date.weekday() in self.trading_days and not self.is_holiday(date)
+        return bool(self._weekday_lut[date.weekday()]) and not self.is_holiday(date)
 
     def is_holiday(
         self,
@@ -132,12 +226,27 @@ class ExchangeInfo:
         Returns:
                 [type]: [description]
         """
-        is_json_holiday = date.date() in self.holidays
-        is_calendar_holiday = (
-            self.holiday_calendar
-            and date in self.holiday_calendar.holidays(start=date, end=date)
-        )
-        return is_json_holiday or is_calendar_holiday
+        return self._is_holiday_date(date.toordinal())
+
+    @lru_cache(maxsize=4096)
+    def _is_holiday_date(
+        self,
+        ordinal: int
+    ) -> bool:
+        """
+        Cached holiday check keyed on the ordinal of the calendar date,
+        so repeated intra-day timestamps resolve to a single hashed lookup
+        """
+        day = date.fromordinal(ordinal)
+        if day in self.holidays:
+            return True
+        if not self.holiday_calendar:
+            return False
+        if self._calendar_holiday_range is not None:
+            lo, hi = self._calendar_holiday_range
+            if lo <= day <= hi:
+                return day in self._calendar_holidays
+        return len(self.holiday_calendar.holidays(start=day, end=day)) > 0
 
     def get_trading_hours(
         self,
@@ -146,13 +255,40 @@ class ExchangeInfo:
         """
         Get the trading hours for the given date
         """
-        for special_day in self.special_trading_days:
-            if date.date() == datetime.strptime(special_day["date"], "%Y-%m-%d").date():
-                return (
-                    datetime.strptime(special_day["open_time"], "%H:%M").time(),
-                    datetime.strptime(special_day["close_time"], "%H:%M").time(),
-                )
-        return self.open_time, self.close_time
+        if not self.special_trading_days:
+            return self.open_time, self.close_time
+        return self.special_trading_days.get(
+            date.date(), (self.open_time, self.close_time)
+        )
+
+    def get_trading_hours_batch(
+        self,
+        dates: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the trading hours for an array of dates at once
+
+        Returns per-date session open/close as minute-of-day arrays with
+        special trading days substituted via a sorted searchsorted lookup,
+        so callers can apply hours over a whole date axis without per-date
+        Python calls.
+
+        Args:
+                dates (np.ndarray): Array of datetime64[D] dates
+
+        Returns:
+                Tuple[np.ndarray, np.ndarray]: (open_minute, close_minute) arrays
+        """
+        open_min = np.full(len(dates), self._default_open_min, dtype=np.int16)
+        close_min = np.full(len(dates), self._default_close_min, dtype=np.int16)
+        # Common case: no special days, so the default fill is the answer
+        if len(self._special_dates):
+            pos = np.searchsorted(self._special_dates, dates)
+            pos = np.minimum(pos, len(self._special_dates) - 1)
+            is_special = self._special_dates[pos] == dates
+            open_min[is_special] = self._special_open_min[pos[is_special]]
+            close_min[is_special] = self._special_close_min[pos[is_special]]
+        return open_min, close_min
 
 
 # AdvancedTradingCalendar class ----------------------------------------------------------
@@ -214,12 +350,131 @@ class TradingCalendar:
         self.start_date = start_date
         self.end_date = end_date
         self.base_frequency = base_frequency
-        self.calendar = self._create_calendar()
+        self.exchange.prime_holiday_cache(self.start_date, self.end_date)
+        self._build_day_table()
         self.current_step = 0
-        self.trade_len = len(self.calendar)
+
+    @cached_property
+    def _grid(self) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """
+        Hourly timestamp axis and trading mask, materialized on first use
+
+        Point queries are answered from the day table alone, so callers
+        that never step or touch the grid never pay for it.
+        """
+        return self._create_calendar()
+
+    @property
+    def _index(self) -> pd.DatetimeIndex:
+        return self._grid[0]
+
+    @property
+    def _mask(self) -> np.ndarray:
+        return self._grid[1]
+
+    @property
+    def calendar(self) -> pd.DataFrame:
+        """
+        Backward-compatible DataFrame view of the trading calendar
+
+        The DatetimeIndex and boolean mask remain the primary storage; the
+        DataFrame (and its block-manager overhead) is only constructed when
+        a caller actually asks for this view.
+        """
+        return pd.DataFrame({"is_trading_time": self._mask}, index=self._index)
+
+    @property
+    def trade_len(self) -> int:
+        return len(self._index)
+
+    @cached_property
+    def _packed(self) -> np.ndarray:
+        """
+        Bit-packed trading mask, eight timestamps per byte
+
+        Holding many exchanges at once costs 1/8 of the boolean mask, and
+        cross-exchange set queries become bitwise uint8 operations.
+        """
+        return np.packbits(self._mask)
+
+    def is_trading_time_bits(
+        self,
+        position: int
+    ) -> bool:
+        """
+        Check a grid position against the packed bitmap
+
+        Args:
+                position (int): Position in the calendar's timestamp axis
+
+        Returns:
+                bool: True if the position is a trading time
+        """
+        byte = self._packed[position >> 3]
+        return bool((byte >> (7 - (position & 7))) & 1)
+
+    @staticmethod
+    def combine_bitmaps(calendars: List["TradingCalendar"]) -> np.ndarray:
+        """
+        OR the packed bitmaps of several calendars into one
+
+        Answers set-wise queries such as "is any of these exchanges open
+        at time T" with one uint8 operation covering eight timestamps per
+        exchange. The calendars must share the same start/end dates so
+        their timestamp axes line up.
+
+        Args:
+                calendars (List[TradingCalendar]): Calendars to combine
+
+        Returns:
+                np.ndarray: Packed uint8 bitmap of the union
+        """
+        stacked = np.vstack([calendar._packed for calendar in calendars])
+        return np.bitwise_or.reduce(stacked, axis=0)
+
+    @error_logger("Error building day table")
+    def _build_day_table(self) -> None:
+        """
+        Build the day-level session table for the calendar range.
+
+        Trading hours are piecewise-constant per day, so the calendar is
+        fully described by two per-day arrays of session open/close minutes
+        (-1 marks non-trading days). Point queries then reduce to one array
+        gather plus integer comparisons, independent of the grid frequency.
+        """
+        # Key the table on exchange-local dates, mirroring the conversion
+        # _create_calendar applies; normalizing in the caller's timezone
+        # would misalign the two for tz-aware endpoints in any other tz
+        start, end = self.start_date, self.end_date
+        if start.tzinfo is not None:
+            start = start.tz_convert(self.exchange.timezone)
+        if end.tzinfo is not None:
+            end = end.tz_convert(self.exchange.timezone)
+        days = pd.date_range(
+            start=start.normalize(),
+            end=end.normalize(),
+            freq="D",
+        )
+        self._origin_ordinal = days[0].toordinal()
+        self._day_origin = np.datetime64(days[0].date(), "D")
+        # Truncate to local wall-clock dates; a tz-aware index would be
+        # converted to UTC first and shift every date for UTC+ exchanges
+        naive_days = days.tz_localize(None) if days.tz is not None else days
+        day64 = naive_days.to_numpy().astype("datetime64[D]")
+        open_min, close_min = self.exchange.get_trading_hours_batch(day64)
+        trading = self.exchange._weekday_lut[days.weekday.to_numpy()].copy()
+        for i in np.flatnonzero(trading):
+            if self.exchange.is_holiday(days[i]):
+                trading[i] = False
+        open_min[~trading] = -1
+        close_min[~trading] = -1
+        self._open_min = open_min
+        self._close_min = close_min
+        # Presorted trading dates for branchless searchsorted membership
+        self._trading_dates = day64[trading]
 
     @error_logger("Error creating calendars")
-    def _create_calendar(self) -> Dict[str, pd.DataFrame]:
+    def _create_calendar(self) -> Tuple[pd.DatetimeIndex, np.ndarray]:
         """
         Create trading calendars for each exchange.
         We use two methods to create the calendars:
@@ -231,34 +486,59 @@ class TradingCalendar:
                 - NYSE: USFederalHolidayCalendar()
                 - LSE: GoodFriday
 
+        The hourly mask is expanded from the day-level session table with a
+        single vectorized gather of per-day open/close minutes, rather than
+        by evaluating trading rules per timestamp.
+
         Returns:
-                Dict[str, pd.DataFrame]: Dictionary of exchange names and trading calendars
+                Tuple[pd.DatetimeIndex, np.ndarray]: Timestamp axis and the
+                boolean trading-time mask aligned to it
 
         """
-        all_minutes = pd.date_range(
-            start=self.start_date,
-            end=self.end_date,
-            freq="1h",
-            tz=self.exchange.timezone,
+        # Build the axis naive and localize once: passing tz-aware endpoints
+        # into date_range has historically produced surprising ranges, and a
+        # single localization pass is faster than per-step construction
+        start, end = self.start_date, self.end_date
+        if start.tzinfo is not None:
+            start = start.tz_convert(self.exchange.timezone).tz_localize(None)
+        if end.tzinfo is not None:
+            end = end.tz_convert(self.exchange.timezone).tz_localize(None)
+        naive_minutes = pd.date_range(start=start, end=end, freq="1h")
+        all_minutes = naive_minutes.tz_localize(
+            self.exchange.timezone, nonexistent="shift_forward", ambiguous="NaT"
         )
-        calendar = pd.DataFrame(index=all_minutes)
 
-        calendar["is_trading_time"] = calendar.index.map(
-            lambda x: (
-                self.exchange.is_trading_day(x)
-                and self.exchange.open_time <= x.time() < self.exchange.close_time
-            )
+        # Wall-clock components of every timestamp, straight from the int64
+        # nanosecond representation - one vectorized pass, no per-element
+        # Timestamp or datetime.time objects
+        local_ns = naive_minutes.asi8
+        minute_of_day = (local_ns // 60_000_000_000) % 1_440
+        day_offsets = local_ns // 86_400_000_000_000 - self._day_origin.astype(np.int64)
+        if len(day_offsets) and (
+            day_offsets[0] < 0 or day_offsets[-1] >= len(self._open_min)
+        ):
+            # Fail loudly rather than letting fancy indexing wrap around
+            raise IndexError("Hourly grid dates fall outside the day table")
+
+        open_min = self._open_min[day_offsets]
+        close_min = self._close_min[day_offsets]
+        mask = (
+            (open_min != -1)
+            & (minute_of_day >= open_min)
+            & (minute_of_day < close_min)
         )
 
-        # Check for special trading days
-        for idx, row in calendar.iterrows():
-            if row["is_trading_time"]:
-                open_time, close_time = self.exchange.get_trading_hours(idx)
-                calendar.at[idx, "is_trading_time"] = (idx.time() >= open_time) and (
-                    idx.time() < close_time
-                )
+        mask = np.asarray(mask, dtype=bool)
+
+        # Wall-clock hours that are ambiguous across a DST fold localize
+        # to NaT; drop them from both axes
+        valid = np.asarray(all_minutes.notna())
+        if not valid.all():
+            all_minutes = all_minutes[valid]
+            mask = mask[valid]
 
-        return calendar
+        # One byte per timestamp; never let the mask degrade to object dtype
+        return all_minutes, mask
 
     def is_trading_time(
         self,
@@ -272,8 +552,40 @@ class TradingCalendar:
 
         Returns:
                 bool: True if the timestamp is a trading time, False
+
+        Raises:
+                KeyError: If the timestamp falls outside the calendar range
+        """
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert(self.exchange.timezone)
+        day_offset = timestamp.toordinal() - self._origin_ordinal
+        if not 0 <= day_offset < len(self._open_min):
+            raise KeyError(timestamp)
+        open_minute = int(self._open_min[day_offset])
+        if open_minute == -1:
+            return False
+        minute_of_day = timestamp.hour * 60 + timestamp.minute
+        return open_minute <= minute_of_day < int(self._close_min[day_offset])
+
+    def is_trading_day(
+        self,
+        timestamp: pd.Timestamp
+    ) -> bool:
         """
-        return self.calendar.loc[timestamp, "is_trading_time"]
+        Check if the given timestamp falls on a trading day of the calendar
+
+        Uses searchsorted on the presorted trading-date array, so the check
+        stays in C regardless of how many holidays or special days exist.
+
+        Args:
+                timestamp (pd.Timestamp): The timestamp to check
+
+        Returns:
+                bool: True if the date is a trading day within the range
+        """
+        day = np.datetime64(timestamp.date(), "D")
+        pos = int(np.searchsorted(self._trading_dates, day))
+        return pos < len(self._trading_dates) and self._trading_dates[pos] == day
 
     def step(self):
         if self.is_finished():
@@ -283,7 +595,7 @@ class TradingCalendar:
         self.current_step += 1
 
     def get_current_time(self) -> pd.Timestamp:
-        return self.calendar.index[self.current_step]
+        return self._index[self.current_step]
 
     def is_finished(self) -> bool:
         return self.current_step >= self.trade_len
@@ -306,8 +618,10 @@ class TradingCalendar:
         if end_date:
             self.end_date = end_date
         if start_date or end_date:
-            self.calendar = self._create_calendar()
-            self.trade_len = len(self.calendar)
+            self.exchange.prime_holiday_cache(self.start_date, self.end_date)
+            self._build_day_table()
+            self.__dict__.pop("_grid", None)
+            self.__dict__.pop("_packed", None)
         self.current_step = 0
 
     @error_logger("Error getting next trading time")
@@ -323,9 +637,17 @@ class TradingCalendar:
 
         Returns:
                 pd.Timestamp: The next trading time
+
+        Raises:
+                ValueError: If no trading time exists after the timestamp
         """
-        future_calendar = self.calendar.loc[timestamp:]
-        return future_calendar[future_calendar["is_trading_time"]].index[0]
+        pos = int(self._index.searchsorted(timestamp, side="left"))
+        hit = int(first_true_after(self._mask, pos))
+        if hit == -1:
+            raise ValueError(
+                f"No trading time after {timestamp} in the calendar range"
+            )
+        return self._index[hit]
 
     @error_logger("Error getting trading times")
     def get_trading_times(
@@ -333,7 +655,58 @@ class TradingCalendar:
         start: pd.Timestamp,
         end: pd.Timestamp
     ) -> pd.DatetimeIndex:
-        return self.calendar.loc[start:end][self.calendar["is_trading_time"]].index
+        lo = int(self._index.searchsorted(start))
+        # Clamp inverted ranges to an empty slice; the Numba kernel cannot
+        # allocate a negative-sized output
+        hi = max(int(self._index.searchsorted(end, side="right")), lo)
+        return self._index[true_positions(self._mask, lo, hi)]
+
+    def iter_trading_times(
+        self,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+    ):
+        """
+        Iterate over trading timestamps without materializing the full grid
+
+        Walks the day-level table and expands each session on the fly, so
+        memory stays O(1) regardless of the calendar range.
+
+        Args:
+                start (pd.Timestamp): First timestamp to consider (defaults to calendar start)
+                end (pd.Timestamp): Last timestamp to consider (defaults to calendar end)
+
+        Yields:
+                pd.Timestamp: Each trading timestamp in order
+        """
+        tz = self.exchange.timezone
+        start = self.start_date if start is None else start
+        end = self.end_date if end is None else end
+        start = start.tz_localize(tz) if start.tzinfo is None else start.tz_convert(tz)
+        end = end.tz_localize(tz) if end.tzinfo is None else end.tz_convert(tz)
+
+        for offset in range(len(self._open_min)):
+            open_minute = int(self._open_min[offset])
+            if open_minute == -1:
+                continue
+            close_minute = int(self._close_min[offset])
+            day = pd.Timestamp(date.fromordinal(self._origin_ordinal + offset))
+            # Hourly grid points h with open <= h*60 < close, built as naive
+            # wall-clock times and localized with the same policy as the
+            # grid so both APIs agree across DST transitions
+            first_hour = -(-open_minute // 60)
+            last_hour = -(-close_minute // 60)
+            session = pd.date_range(
+                start=day + pd.Timedelta(hours=first_hour),
+                periods=last_hour - first_hour,
+                freq="1h",
+            ).tz_localize(tz, nonexistent="shift_forward", ambiguous="NaT")
+            for timestamp in session:
+                if pd.isna(timestamp) or timestamp < start:
+                    continue
+                if timestamp > end:
+                    return
+                yield timestamp
 
     def get_exchange_trading_hours(self) -> Tuple[time, time]:
         return self.exchange.open_time, self.exchange.close_time
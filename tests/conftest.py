@@ -0,0 +1,36 @@
+"""
+Pytest setup for the QuantJourney Trading Calendar package.
+
+The local ``calendar`` package shadows the standard-library module of the
+same name, and pandas imports the standard-library ``calendar`` while it
+initializes.  Import pandas here, before any test module pulls in the local
+package, so that both modules resolve cleanly.
+"""
+
+import os
+import sys
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _preload_pandas():
+    # Import pandas with the repository root off sys.path so its internal
+    # ``import calendar`` resolves to the standard library, then restore the
+    # path so test modules import the local ``calendar`` package.
+    removed = []
+    for entry in list(sys.path):
+        resolved = os.path.abspath(entry) if entry else os.getcwd()
+        if resolved == _REPO_ROOT:
+            removed.append(entry)
+            sys.path.remove(entry)
+    try:
+        import pandas  # noqa: F401
+    finally:
+        for entry in removed:
+            sys.path.insert(0, entry)
+    sys.modules.pop("calendar", None)
+    if not removed:
+        sys.path.insert(0, _REPO_ROOT)
+
+
+_preload_pandas()
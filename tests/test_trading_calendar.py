@@ -2,6 +2,9 @@
 Test suite for the QuantJourney Trading Calendar package.
 """
 
+import json
+
+import numpy as np
 import pytest
 import pandas as pd
 from calendar import ExchangeInfo, TradingCalendar
@@ -39,6 +42,54 @@ def test_trading_day_check(adx_exchange):
     holiday = pd.Timestamp("2024-01-01", tz="Asia/Dubai")  # New Year's Day
     assert not adx_exchange.is_trading_day(holiday)
 
+def test_calendar_trading_day_check(trading_calendar):
+    """Test trading day verification against the calendar's date range."""
+    assert trading_calendar.is_trading_day(pd.Timestamp("2024-01-02"))
+    assert not trading_calendar.is_trading_day(pd.Timestamp("2024-01-06"))  # Saturday
+    assert not trading_calendar.is_trading_day(pd.Timestamp("2024-01-01"))  # Holiday
+
+def test_tz_aware_endpoints(adx_exchange):
+    """Test that tz-aware start/end dates keep day-table dates in local time."""
+    calendar = TradingCalendar(
+        adx_exchange,
+        pd.Timestamp("2024-01-01", tz="Asia/Dubai"),
+        pd.Timestamp("2024-01-31", tz="Asia/Dubai"),
+    )
+    assert calendar.is_trading_day(pd.Timestamp("2024-01-02"))
+    assert not calendar.is_trading_day(pd.Timestamp("2024-01-01"))  # Holiday
+    assert not calendar.is_trading_day(pd.Timestamp("2024-01-06"))  # Saturday
+
+    # Special trading day hours must be keyed on the local date too
+    july = TradingCalendar(
+        adx_exchange,
+        pd.Timestamp("2024-07-01", tz="Asia/Dubai"),
+        pd.Timestamp("2024-07-05", tz="Asia/Dubai"),
+    )
+    assert not july.is_trading_time(pd.Timestamp("2024-07-01 10:00", tz="Asia/Dubai"))
+    assert july.is_trading_time(pd.Timestamp("2024-07-01 11:00", tz="Asia/Dubai"))
+
+def test_endpoints_in_foreign_timezone():
+    """Test endpoints tz-aware in a different timezone than the exchange."""
+    nyse = ExchangeInfo("calendar/exchange_calendars/NYSE.json")
+    calendar = TradingCalendar(
+        nyse,
+        pd.Timestamp("2024-01-02", tz="Asia/Tokyo"),
+        pd.Timestamp("2024-01-10", tz="Asia/Tokyo"),
+    )
+    # 2024-01-01 is a NYSE holiday; nothing may trade on it
+    new_years = calendar.get_trading_times(
+        pd.Timestamp("2024-01-01", tz="America/New_York"),
+        pd.Timestamp("2024-01-02", tz="America/New_York"),
+    )
+    assert len(new_years) == 0
+    # A regular day keeps its full session in exchange-local time
+    assert calendar.is_trading_time(
+        pd.Timestamp("2024-01-03 10:00", tz="America/New_York")
+    )
+    assert not calendar.is_trading_time(
+        pd.Timestamp("2024-01-03 17:00", tz="America/New_York")
+    )
+
 def test_trading_time_check(trading_calendar):
     """Test trading time verification."""
     # During trading hours
@@ -57,6 +108,16 @@ def test_next_trading_time(trading_calendar):
     assert next_trading.date() == pd.Timestamp("2024-01-03").date()
     assert next_trading.hour == 10  # Market open time
 
+def test_calendar_mask_dtype(trading_calendar):
+    """Test that the trading mask is a packed boolean array."""
+    assert trading_calendar._mask.dtype == np.bool_
+
+def test_next_trading_time_out_of_range(trading_calendar):
+    """Test next trading time when nothing follows in the calendar range."""
+    after_range = pd.Timestamp("2024-02-15", tz="Asia/Dubai")
+    with pytest.raises(ValueError):
+        trading_calendar.get_next_trading_time(after_range)
+
 def test_trading_times_range(trading_calendar):
     """Test getting trading times within a range."""
     start = pd.Timestamp("2024-01-03", tz="Asia/Dubai")
@@ -68,6 +129,50 @@ def test_trading_times_range(trading_calendar):
     assert trading_times[0].hour == 10
     assert trading_times[-1].hour == 13
 
+def test_step_across_dst_transition():
+    """Test stepping through a DST spring-forward week without errors."""
+    nyse = ExchangeInfo("calendar/exchange_calendars/NYSE.json")
+    calendar = TradingCalendar(
+        nyse, pd.Timestamp("2024-03-09"), pd.Timestamp("2024-03-12")
+    )
+    times = []
+    while not calendar.is_finished():
+        times.append(calendar.get_current_time())
+        calendar.step()
+    assert len(times) == calendar.trade_len
+
+def test_iter_trading_times(trading_calendar):
+    """Test the streaming iterator matches the materialized calendar."""
+    start = pd.Timestamp("2024-01-03", tz="Asia/Dubai")
+    end = pd.Timestamp("2024-01-04", tz="Asia/Dubai")
+    streamed = list(trading_calendar.iter_trading_times(start, end))
+    materialized = list(trading_calendar.get_trading_times(start, end))
+    assert streamed == materialized
+
+def test_iter_trading_times_dst_fall_back(tmp_path):
+    """Test the iterator matches the grid across a DST fall-back Sunday."""
+    config = {
+        "name": "TASE",
+        "timezone": "Asia/Jerusalem",
+        "open_time": "09:00",
+        "close_time": "17:00",
+        "trading_days": [6, 0, 1, 2, 3],
+        "holidays": [],
+    }
+    config_path = tmp_path / "TASE.json"
+    config_path.write_text(json.dumps(config))
+    calendar = TradingCalendar(
+        ExchangeInfo(str(config_path)),
+        pd.Timestamp("2024-10-25"),
+        pd.Timestamp("2024-10-30"),
+    )
+    # 2024-10-27 is a trading Sunday on which Israel leaves DST
+    start = pd.Timestamp("2024-10-25", tz="Asia/Jerusalem")
+    end = pd.Timestamp("2024-10-30", tz="Asia/Jerusalem")
+    streamed = list(calendar.iter_trading_times(start, end))
+    materialized = list(calendar.get_trading_times(start, end))
+    assert streamed == materialized
+
 def test_special_trading_day(adx_exchange):
     """Test special trading day handling."""
     special_day = pd.Timestamp("2024-07-01", tz="Asia/Dubai")
@@ -75,4 +180,25 @@ def test_special_trading_day(adx_exchange):
     assert open_time.hour == 10
     assert open_time.minute == 30
     assert close_time.hour == 13
-    assert close_time.minute == 30 
\ No newline at end of file
+    assert close_time.minute == 30
+
+def test_trading_times_inverted_range(trading_calendar):
+    """Test that an inverted range yields an empty result."""
+    start = pd.Timestamp("2024-01-04", tz="Asia/Dubai")
+    end = pd.Timestamp("2024-01-03", tz="Asia/Dubai")
+    assert len(trading_calendar.get_trading_times(start, end)) == 0
+
+def test_packed_bitmap(trading_calendar):
+    """Test that the packed bitmap agrees with the boolean mask."""
+    mask = trading_calendar._mask
+    for position in (0, 10, 11, len(mask) - 1):
+        assert trading_calendar.is_trading_time_bits(position) == bool(mask[position])
+    combined = TradingCalendar.combine_bitmaps([trading_calendar, trading_calendar])
+    assert np.array_equal(combined, trading_calendar._packed)
+
+def test_trading_hours_batch(adx_exchange):
+    """Test vectorized trading hours lookup over a date axis."""
+    dates = np.array(["2024-06-30", "2024-07-01"], dtype="datetime64[D]")
+    open_min, close_min = adx_exchange.get_trading_hours_batch(dates)
+    assert open_min.tolist() == [10 * 60, 10 * 60 + 30]
+    assert close_min.tolist() == [14 * 60, 13 * 60 + 30] 
\ No newline at end of file